@@ -0,0 +1,256 @@
+"""
+Parsing and plotting helpers shared by the RLNC `divan` benchmark plot scripts.
+"""
+
+import functools
+import numpy as np
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+# matplotlib is only imported once something is to be drawn, see `plot_rc_context`
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+CONFIG_MARKER = 'data split into'
+
+# Binary multiples, as used by `bytes_to_human_readable` of benchmark programs
+SIZE_UNITS = {'B': 1, 'KB': 1 << 10, 'MB': 1 << 20, 'GB': 1 << 30, 'TB': 1 << 40}
+
+# Plots are just axes, gridlines and a few markers, 150 dpi is already print quality,
+# while costing ~4x less rasterization and PNG encoding time than 300 dpi
+DEFAULT_DPI = 150
+
+# Piece counts benchmarked, built once, so it isn't converted from a list on every plot
+XTICKS = np.array([4, 8, 16, 32, 64, 128, 256, 512])
+
+@functools.lru_cache(maxsize=4)
+def parse_divan_table(data: str) -> Mapping:
+    """
+    Parses `divan` benchmark output into a mapping of (data size in bytes, data size label) to
+    (pieces, median throughput) arrays. Handles throughput values in both GiB/s and MiB/s, always
+    returning GiB/s. Results are cached, so they're returned as a read-only mapping of read-only
+    arrays, which callers must copy before modifying.
+    """
+    # Fields of each row, kept as strings, so that they're converted to numbers in bulk, below
+    labels, size_values, size_units, piece_strs, tp_strs, is_mib = [], [], [], [], [], []
+
+    lines_iter = iter(data.splitlines())
+
+    for line in lines_iter:
+        # Cheap substring test skips headers, borders and throughput rows
+        if CONFIG_MARKER not in line:
+            continue
+
+        left, _, right = line.partition(CONFIG_MARKER)
+        size_value, size_unit = left.rsplit(None, 2)[-2:]
+
+        # Throughput row always follows its config row
+        tp_line = next(lines_iter, '')
+
+        # Throughput columns are 'fastest │ slowest │ median │ mean'
+        columns = [col.strip() for col in tp_line.split('│') if col.strip()]
+
+        if len(columns) >= 4:
+            median_throughput_str = columns[2]
+
+            # Conversion to GiB/s happens below, for all MiB/s rows at once
+            if median_throughput_str.endswith(("GiB/s", "MiB/s")):
+                value, unit = median_throughput_str.split()
+
+                labels.append(f'{size_value} {size_unit}')
+                size_values.append(size_value)
+                size_units.append(SIZE_UNITS[size_unit])
+                piece_strs.append(right.split()[0])
+                tp_strs.append(value)
+                is_mib.append(unit == 'MiB/s')
+
+    if not labels:
+        return MappingProxyType({})
+
+    # Keyed on byte count, so that series sort numerically, not lexicographically
+    size_bytes = (np.asarray(size_values, dtype=np.float64) * np.asarray(size_units)).astype(np.int64)
+    pieces = np.asarray(piece_strs, dtype=np.int64)
+    throughputs = np.asarray(tp_strs, dtype=np.float64)
+    throughputs[np.asarray(is_mib)] /= 1024
+
+    # Order by data size, then by pieces, so that each group of rows is already sorted
+    order = np.lexsort((pieces, size_bytes))
+    size_bytes, pieces, throughputs = size_bytes[order], pieces[order], throughputs[order]
+    sizes, group_starts = np.unique(size_bytes, return_index=True)
+
+    parsed = {}
+    for size, start, group_pieces, group_throughputs in zip(
+        sizes, group_starts, np.split(pieces, group_starts[1:]), np.split(throughputs, group_starts[1:])
+    ):
+        # Each caller gets these same arrays, so none of them may modify those, in place, for others
+        group_pieces.flags.writeable = False
+        group_throughputs.flags.writeable = False
+        parsed[(int(size), labels[order[start]])] = (group_pieces, group_throughputs)
+
+    return MappingProxyType(parsed)
+
+# One row per benchmarked configuration, as baked by `bake_bench_results`, already in order of data size, then pieces
+BAKED_DTYPE = np.dtype([('size_bytes', np.int64), ('label', 'U16'), ('pieces', np.int64), ('throughput', np.float64)])
+
+def _baked_path(bench_data_path: Path) -> Path:
+    return bench_data_path.with_suffix('.npy')
+
+def bake_bench_results(bench_data_path: Path) -> Path:
+    """
+    Parses benchmark output stored in given text file, once, saving parsed results as a `.npy` file next to it.
+    """
+    results = sorted(parse_divan_table(bench_data_path.read_text(encoding='utf-8')).items())
+
+    baked = np.array([
+        (size_bytes, label, num_pieces, throughput)
+        for (size_bytes, label), (pieces, throughputs) in results
+        for num_pieces, throughput in zip(pieces, throughputs)
+    ], dtype=BAKED_DTYPE)
+
+    baked_path = _baked_path(bench_data_path)
+    # Uncompressed, single array file, so that loading it is one read, without zip archive handling
+    np.save(baked_path, baked)
+    return baked_path
+
+def load_bench_results(bench_data_path: Path) -> Mapping:
+    """
+    Loads parsed benchmark results of given text file, from its baked `.npy` file when that's newer than the
+    text file, otherwise by parsing the text file. Returned mapping is same as that of `parse_divan_table`.
+    """
+    baked_path = _baked_path(bench_data_path)
+
+    # Comparing modification times, like `make` does, never needs the text file to be read
+    try:
+        is_fresh = baked_path.stat().st_mtime_ns >= bench_data_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        is_fresh = False
+
+    if not is_fresh:
+        return parse_divan_table(bench_data_path.read_text(encoding='utf-8'))
+
+    baked = np.load(baked_path)
+    if not baked.size:
+        return {}
+
+    _, group_starts = np.unique(baked['size_bytes'], return_index=True)
+
+    return {
+        (int(group['size_bytes'][0]), str(group['label'][0])): (group['pieces'], group['throughput'])
+        for group in np.split(baked, group_starts[1:])
+    }
+
+# Pin the font shipped with matplotlib, so that font lookup never has to search system fonts.
+# Let Agg drop vertices which don't visibly change a line, drawing long lines in chunks of vertices.
+PLOT_RC_PARAMS = {
+    'font.family': 'DejaVu Sans', 'text.usetex': False, 'axes.unicode_minus': False,
+    'path.simplify': True, 'path.simplify_threshold': 1.0, 'agg.path.chunksize': 10000,
+}
+
+def plot_rc_context():
+    """
+    Returns a context manager applying `PLOT_RC_PARAMS`, within which figures are to be created, drawn and saved.
+    Global matplotlib settings of the caller are restored on leaving it. matplotlib is only imported on first call,
+    so that parsing benchmark results or asking a script for `--help` never pays for importing it.
+    """
+    import matplotlib
+    return matplotlib.rc_context(PLOT_RC_PARAMS)
+
+def render_on_ax(ax, results: Mapping, title: str, xlabel: str):
+    """
+    Draws the median throughput plot of already parsed benchmark results on given axes.
+    Axes are cleared first, so the same figure can be reused for rendering many plots.
+    """
+    import matplotlib.ticker as mticker
+
+    ax.cla()
+
+    series = sorted(results.items())
+    labels = [f'{data_size} data' for (_, data_size), _ in series]
+
+    # Draw all series with a single call, as columns of one matrix sharing the x axis.
+    # Pieces missing from some series are left as NaN, which matplotlib doesn't draw.
+    lines = []
+    if series:
+        x = np.unique(np.concatenate([pieces for _, (pieces, _) in series]))
+        Y = np.full((len(series), len(x)), np.nan)
+        for row, (_, (pieces, throughputs)) in zip(Y, series):
+            row[np.searchsorted(x, pieces)] = throughputs
+
+        lines = ax.plot(x, Y.T, marker='o', markersize=4, linestyle='-')
+
+    # --- Formatting the Plot ---
+    ax.set_xscale('log', base=2)
+    # A formatter gets bound to the axis it's set on, so it can't be shared across plots like ticks
+    ax.xaxis.set_major_formatter(mticker.ScalarFormatter())
+    ax.set_xticks(XTICKS)
+
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel('Median Throughput (GiB/s)', fontsize=12)
+
+    ax.legend(lines, labels, title='Total Data Size')
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+
+def parse_cli_args(description: str, default_output_filename: str):
+    """
+    Parses command line arguments of a plot script, returning output filename and dpi.
+    """
+    # Only scripts run from the command line ever need `argparse`
+    import argparse
+
+    parser = argparse.ArgumentParser(description=description)
+    # Positional output filename is what scripts took before options were added, so it keeps working
+    parser.add_argument('output', nargs='?', default=default_output_filename, help='output image filename (default: %(default)s)')
+    parser.add_argument('-o', '--output', dest='output_option', metavar='OUTPUT', help='output image filename, overriding positional one')
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI, help='resolution of PNG output, ignored for SVG (default: %(default)s)')
+    parser.add_argument('--format', choices=['png', 'svg'], help='output image format, replacing extension of output filename')
+    args = parser.parse_args()
+
+    output_filename = args.output if args.output_option is None else args.output_option
+    if args.format is not None:
+        output_filename = str(Path(output_filename).with_suffix(f'.{args.format}'))
+
+    return output_filename, args.dpi
+
+def save_figure(fig, output_filename: str, dpi: int = DEFAULT_DPI):
+    """
+    Saves the figure to a file. SVG output is never rasterized, so `dpi` is ignored for it.
+    """
+    # Compared case-insensitively, so that, say, `OUT.PNG` takes the same fast PNG path
+    suffix = Path(output_filename).suffix.lower()
+
+    if suffix == '.svg':
+        fig.savefig(output_filename)
+    elif suffix == '.png':
+        # Render straight through the Agg canvas, skipping savefig's pyplot and backend dispatch
+        fig.set_dpi(dpi)
+        # zlib level 1 encodes several times faster than the default level 6, for slightly larger files
+        fig.canvas.print_png(output_filename, pil_kwargs={'compress_level': 1, 'optimize': False})
+    else:
+        fig.savefig(output_filename, dpi=dpi)
+
+def new_figure(figsize: tuple) -> 'Figure':
+    """
+    Creates a figure drawn on an Agg canvas. It isn't tracked by pyplot, so it never has to be closed.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize, constrained_layout=True)
+    FigureCanvasAgg(fig)
+    return fig
+
+def render(results: Mapping, title: str, xlabel: str, output_filename: str, dpi: int = DEFAULT_DPI):
+    """
+    Saves the median throughput plot of already parsed benchmark results to a file.
+    """
+    with plot_rc_context():
+        fig = new_figure((12, 7))
+        ax = fig.add_subplot(111)
+        render_on_ax(ax, results, title, xlabel)
+
+        # --- Save the plot to a file ---
+        save_figure(fig, output_filename, dpi)
+
+    print(f"Plot successfully saved to {output_filename}")
@@ -0,0 +1,19 @@
+#!/usr/bin/python
+
+from _rlnc_plot import bake_bench_results
+import plot_encoder_bench_result as encoder
+import plot_recoder_bench_result as recoder
+import plot_decoder_bench_result as decoder
+
+def bake_all():
+    """
+    Parses benchmark results of RLNC encoder, recoder and decoder, saving them in `.npy` form, so that plot scripts
+    load them straight away, instead of parsing. Needs to be run again after updating any of the benchmark results,
+    otherwise plot scripts notice baked results being older than their data files and fall back to parsing.
+    """
+    for script in (encoder, recoder, decoder):
+        baked_path = bake_bench_results(script.BENCH_DATA_PATH)
+        print(f"Baked {script.BENCH_DATA_PATH.name} into {baked_path.name}")
+
+if __name__ == '__main__':
+    bake_all()
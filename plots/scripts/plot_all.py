@@ -0,0 +1,26 @@
+#!/usr/bin/python
+
+from _rlnc_plot import DEFAULT_DPI, load_bench_results, new_figure, parse_cli_args, plot_rc_context, render_on_ax, save_figure
+import plot_encoder_bench_result as encoder
+import plot_decoder_bench_result as decoder
+
+def parse_and_save_plots(output_filename: str, dpi: int = DEFAULT_DPI):
+    """
+    Parses both encoder and decoder benchmark data and saves their median throughput plots, side by side, to one file.
+    """
+    with plot_rc_context():
+        fig = new_figure((20, 7))
+        ax1, ax2 = fig.subplots(1, 2)
+
+        render_on_ax(ax1, load_bench_results(encoder.BENCH_DATA_PATH), encoder.PLOT_TITLE, encoder.PLOT_XLABEL)
+        render_on_ax(ax2, load_bench_results(decoder.BENCH_DATA_PATH), decoder.PLOT_TITLE, decoder.PLOT_XLABEL)
+
+        # --- Save the plot to a file ---
+        save_figure(fig, output_filename, dpi)
+
+    print(f"Plot successfully saved to {output_filename}")
+
+if __name__ == '__main__':
+    # Run the function to generate and save the image
+    output_filename, dpi = parse_cli_args('Plots RLNC Encoder and Decoder median throughput benchmark results side by side.', "rlnc_median_throughput.png")
+    parse_and_save_plots(output_filename, dpi)